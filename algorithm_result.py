@@ -0,0 +1,160 @@
+"""Structured results returned by the AlgorithmsFacade.
+
+A result keeps the raw value produced by an algorithm and only builds text
+when asked to. Previews only abbreviate output that is genuinely large:
+sequences of more than 1000 items and strings of more than 1000 characters
+keep their first/last parts, and integers of more than 4000 digits are shown
+by digit count, so ordinary results look exactly like their full text.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from .instrumentation import MetricsRegistry
+
+# Sequences (items) and strings (characters) longer than
+# 2 * DEFAULT_PREVIEW_ITEMS are elided in previews.
+DEFAULT_PREVIEW_ITEMS = 500
+# Just under the interpreter's default 4300-digit str() limit, so every int
+# the GUI could display before is still shown in full.
+DEFAULT_PREVIEW_DIGITS = 4000
+
+_LOG10_2 = math.log10(2)
+_SMALL_INT_BITS = 4096  # about 1233 digits, well under the str() digit limit
+
+# A formatter turns one value into text. ``sep`` joins sequence items
+# (None keeps the Python list representation).
+Formatter = Callable[..., str]
+
+
+def _int_to_decimal(value: int) -> str:
+    """Exact decimal text for ints of any size.
+
+    ``str(int)`` is quadratic and refuses values above the interpreter's
+    digit limit, so large values are split around a power of ten and each
+    half is converted separately.
+    """
+    if value < 0:
+        return "-" + _int_to_decimal(-value)
+    if value.bit_length() <= _SMALL_INT_BITS:
+        return str(value)
+    k = int(value.bit_length() * _LOG10_2) // 2
+    high, low = divmod(value, 10**k)
+    return _int_to_decimal(high) + _int_to_decimal(low).zfill(k)
+
+
+def _digit_count(value: int) -> int:
+    digits = int(value.bit_length() * _LOG10_2) + 1
+    if value < 10 ** (digits - 1):
+        digits -= 1
+    return digits
+
+
+def _format_int(value: int, max_digits: Optional[int]) -> str:
+    if max_digits is None:
+        return _int_to_decimal(value)
+    if value.bit_length() <= _SMALL_INT_BITS:
+        text = str(value)
+        if len(text.lstrip("-")) <= max_digits:
+            return text
+    sign = "-" if value < 0 else ""
+    value = abs(value)
+    digits = _digit_count(value)
+    if digits <= max_digits:
+        return sign + _int_to_decimal(value)
+    half = max(1, max_digits // 2)
+    head = value // 10 ** (digits - half)
+    tail = str(value % 10**half).zfill(half)
+    return f"{sign}{head}...{tail} ({digits} digits)"
+
+
+def format_value(
+    value: Any,
+    sep: Optional[str] = None,
+    max_items: Optional[int] = None,
+    max_digits: Optional[int] = None,
+) -> str:
+    """Format ``value`` for display.
+
+    With ``max_items``/``max_digits`` left as None the full text is produced.
+    Otherwise sequences longer than ``2 * max_items`` keep their first and last
+    ``max_items`` elements, strings are cut the same way by characters, and
+    integers longer than ``max_digits`` digits are abbreviated.
+    """
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, str):
+        n = len(value)
+        if max_items is not None and n > 2 * max_items:
+            return f"{value[:max_items]}... ({n - 2 * max_items} more chars) ...{value[-max_items:]}"
+        return value
+    if isinstance(value, int):
+        return _format_int(value, max_digits)
+    if isinstance(value, (list, tuple)):
+        n = len(value)
+        if max_items is not None and n > 2 * max_items:
+            head = [format_value(v, max_digits=max_digits) for v in value[:max_items]]
+            tail = [format_value(v, max_digits=max_digits) for v in value[-max_items:]]
+            joiner = ", " if sep is None else sep
+            body = joiner.join(head) + f"{joiner}... ({n - 2 * max_items} more) ...{joiner}" + joiner.join(tail)
+            return body if sep is not None else f"[{body}]"
+        if sep is not None:
+            return sep.join(format_value(v, max_digits=max_digits) for v in value)
+        if max_digits is None:
+            return str(list(value))
+        return "[" + ", ".join(format_value(v, max_digits=max_digits) for v in value) + "]"
+    return str(value)
+
+
+@dataclass
+class AlgorithmResult:
+    """Outcome of one facade call.
+
+    ``value`` holds the raw algorithm output. ``template`` receives a formatter
+    and returns the display text, so formatting only happens in ``text()`` or
+    ``preview()`` and the full text is built at most once. When ``metrics`` is
+    set (the facade does this while instrumentation is enabled) formatting
+    time is recorded under ``format.text`` / ``format.preview``.
+    """
+
+    algorithm: str
+    value: Any
+    template: Callable[[Formatter], str] = field(repr=False)
+    metrics: Optional["MetricsRegistry"] = field(default=None, repr=False)
+    _full_text: Optional[str] = field(default=None, init=False, repr=False)
+
+    def _render(self, stage: str, fmt: Formatter) -> str:
+        if self.metrics is None or not self.metrics.enabled:
+            return self.template(fmt)
+        with self.metrics.stage(stage):
+            return self.template(fmt)
+
+    def text(self) -> str:
+        """Full, untruncated text (cached after the first call)."""
+        if self._full_text is None:
+            self._full_text = self._render("format.text", lambda v, sep=None: format_value(v, sep=sep))
+        return self._full_text
+
+    def preview(
+        self,
+        max_items: int = DEFAULT_PREVIEW_ITEMS,
+        max_digits: int = DEFAULT_PREVIEW_DIGITS,
+    ) -> str:
+        """Display text, abbreviated only where the result is very large."""
+        return self._render(
+            "format.preview",
+            lambda v, sep=None: format_value(v, sep=sep, max_items=max_items, max_digits=max_digits),
+        )
+
+    def save(self, path: str) -> None:
+        """Write the full text to ``path`` without going through a widget."""
+        with open(path, "w", encoding="utf-8") as fh:
+            fh.write(self.text())
+            fh.write("\n")
+
+    def __str__(self) -> str:
+        return self.text()
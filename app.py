@@ -7,9 +7,11 @@ Run:
 from __future__ import annotations
 
 import tkinter as tk
-from tkinter import ttk, messagebox
-from typing import Any, Dict, List
+from collections import deque
+from tkinter import filedialog, ttk, messagebox
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+from patterns.algorithm_result import AlgorithmResult
 from patterns.creational_factory import CommandFactory
 from patterns.structural_facade import AlgorithmsFacade
 
@@ -20,12 +22,18 @@ ALGORITHMS = [
     "Selection Sort",
     "Bubble Sort",
     "Merge Sort",
+    "Top-k (Heap)",
+    "Incremental Sort (Heap)",
     "Shuffle Deck",
     "Factorial (Recursion)",
     "Array Statistics",
     "Palindrome Substrings (DP)",
+    "Palindrome Analytics (Eertree)",
 ]
 
+# "Show Full Result" offers saving to a file instead above this size.
+FULL_RESULT_WARN_CHARS = 200_000
+
 
 def parse_int_array(text: str) -> List[int]:
     raw = text.strip()
@@ -35,6 +43,95 @@ def parse_int_array(text: str) -> List[int]:
     return [int(p) for p in parts if p != ""]
 
 
+class OutputPane(ttk.Frame):
+    """Scrollable output that keeps only the most recent results.
+
+    Text is inserted in chunks from ``after()`` callbacks so that large
+    renderings do not freeze the UI. Once more than ``max_entries`` results
+    or more than ``max_chars`` characters are held, the oldest entries are
+    removed from the widget (the newest entry is always kept).
+    """
+
+    CHUNK_CHARS = 8192
+
+    def __init__(self, master: Any, max_entries: int = 20, max_chars: int = 2_000_000) -> None:
+        super().__init__(master)
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.text = tk.Text(self, height=16, wrap="word")
+        self.text.grid(row=0, column=0, sticky="nsew")
+        scroll = ttk.Scrollbar(self, orient="vertical", command=self.text.yview)
+        scroll.grid(row=0, column=1, sticky="ns")
+        self.text.configure(yscrollcommand=scroll.set)
+
+        # (start mark, result, size) of the entries in the widget, oldest first.
+        self._history: Deque[Tuple[str, AlgorithmResult, int]] = deque()
+        self._history_chars = 0
+        # Entries waiting to be (fully) inserted: (mark, result, text, offset).
+        self._pending: Deque[Tuple[str, AlgorithmResult, str, int]] = deque()
+        self._job: Optional[str] = None
+        self._counter = 0
+
+    @property
+    def last_result(self) -> Optional[AlgorithmResult]:
+        if self._pending:
+            return self._pending[-1][1]
+        if self._history:
+            return self._history[-1][1]
+        return None
+
+    def append(self, result: AlgorithmResult, full: bool = False) -> None:
+        text = (result.text() if full else result.preview()) + "\n"
+        self._counter += 1
+        self._pending.append((f"entry{self._counter}", result, text, 0))
+        if self._job is None:
+            self._job = self.after_idle(self._render_next)
+
+    def clear(self) -> None:
+        if self._job is not None:
+            self.after_cancel(self._job)
+            self._job = None
+        self._pending.clear()
+        for mark, _, _ in self._history:
+            self.text.mark_unset(mark)
+        self._history.clear()
+        self._history_chars = 0
+        self.text.delete("1.0", tk.END)
+
+    def _render_next(self) -> None:
+        self._job = None
+        if not self._pending:
+            return
+        mark, result, text, offset = self._pending.popleft()
+        if offset == 0:
+            self._start_entry(mark, result, len(text))
+        chunk = text[offset : offset + self.CHUNK_CHARS]
+        self.text.insert(tk.END, chunk)
+        offset += len(chunk)
+        if offset < len(text):
+            self._pending.appendleft((mark, result, text, offset))
+        else:
+            self.text.see(tk.END)
+        if self._pending:
+            self._job = self.after(1, self._render_next)
+
+    def _start_entry(self, mark: str, result: AlgorithmResult, size: int) -> None:
+        self.text.mark_set(mark, "end-1c")
+        self.text.mark_gravity(mark, "left")
+        self._history.append((mark, result, size))
+        self._history_chars += size
+        while len(self._history) > 1 and (
+            len(self._history) > self.max_entries or self._history_chars > self.max_chars
+        ):
+            old_mark, _, old_size = self._history.popleft()
+            self.text.delete("1.0", self._history[0][0])
+            self.text.mark_unset(old_mark)
+            self._history_chars -= old_size
+
+
 class App(tk.Tk):
     def __init__(self) -> None:
         super().__init__()
@@ -81,9 +178,13 @@ class App(tk.Tk):
         self.run_btn.grid(row=0, column=0, sticky="w")
         self.clear_btn = ttk.Button(btns, text="Clear Output", command=self._clear_output)
         self.clear_btn.grid(row=0, column=1, sticky="w", padx=(8, 0))
+        self.full_btn = ttk.Button(btns, text="Show Full Result", command=self._show_full_result)
+        self.full_btn.grid(row=0, column=2, sticky="w", padx=(8, 0))
+        self.save_btn = ttk.Button(btns, text="Save Full Result...", command=self._save_full_result)
+        self.save_btn.grid(row=0, column=3, sticky="w", padx=(8, 0))
 
         ttk.Label(right, text="Output", font=("Arial", 12, "bold")).grid(row=3, column=0, sticky="w", pady=(12, 0))
-        self.output = tk.Text(right, height=16, wrap="word")
+        self.output = OutputPane(right)
         self.output.grid(row=4, column=0, sticky="nsew", pady=(6, 0))
 
     def _on_select(self, _event: Any) -> None:
@@ -129,17 +230,25 @@ class App(tk.Tk):
                 row += 1
             return
 
-        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Array Statistics"):
+        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Top-k (Heap)", "Incremental Sort (Heap)", "Array Statistics"):
             self._add_entry(row, "array", "Array (comma-separated)")
             row += 1
 
-        if name in ("Selection Sort", "Bubble Sort", "Merge Sort"):
+        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Top-k (Heap)", "Incremental Sort (Heap)"):
             self.widgets["ascending"] = tk.StringVar(value="Ascending")
             ttk.Label(self.inputs_frame, text="Order").grid(row=row, column=0, sticky="w")
             order_box = ttk.Combobox(self.inputs_frame, textvariable=self.widgets["ascending"], values=["Ascending", "Descending"], state="readonly")
             order_box.grid(row=row, column=1, sticky="ew")
             row += 1
 
+        if name == "Top-k (Heap)":
+            self._add_entry(row, "k", "k")
+            row += 1
+
+        if name == "Incremental Sort (Heap)":
+            self._add_entry(row, "k", "First k results (blank = all)")
+            row += 1
+
         if name in ("Fibonacci (DP)", "Factorial (Recursion)"):
             self._add_entry(row, "n", "n")
             row += 1
@@ -148,7 +257,7 @@ class App(tk.Tk):
             self._add_entry(row, "seed", "Optional seed (int)")
             row += 1
 
-        if name == "Palindrome Substrings (DP)":
+        if name in ("Palindrome Substrings (DP)", "Palindrome Analytics (Eertree)"):
             self._add_entry(row, "text", "Input string")
             row += 1
 
@@ -159,15 +268,49 @@ class App(tk.Tk):
         self.widgets[key] = ent
 
     def _clear_output(self) -> None:
-        self.output.delete("1.0", tk.END)
+        self.output.clear()
+
+    def _show_full_result(self) -> None:
+        result = self.output.last_result
+        if result is None:
+            messagebox.showinfo("Show Full Result", "Run an algorithm first.")
+            return
+        size = len(result.text())
+        if size > FULL_RESULT_WARN_CHARS:
+            answer = messagebox.askyesnocancel(
+                "Show Full Result",
+                f"The full result is {size:,} characters and may make the window slow.\n\n"
+                "Save it to a file instead?\n(No shows it in the window anyway.)",
+            )
+            if answer is None:
+                return
+            if answer:
+                self._save_full_result()
+                return
+        self.output.append(result, full=True)
+
+    def _save_full_result(self) -> None:
+        result = self.output.last_result
+        if result is None:
+            messagebox.showinfo("Save Full Result", "Run an algorithm first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".txt", filetypes=[("Text files", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            result.save(path)
+        except OSError as e:
+            messagebox.showerror("Error", str(e))
 
     def _run(self) -> None:
         try:
-            params = self._collect_params()
+            with self.facade.metrics.stage("app.parse"):
+                params = self._collect_params()
             cmd = self.factory.create(self.current_algorithm, params)
             result = cmd.execute()
-            self.output.insert(tk.END, result + "\n")
-            self.output.see(tk.END)
+            # Only a bounded preview goes into the widget; the full text is
+            # available through "Show Full Result" and "Save Full Result".
+            self.output.append(result)
         except Exception as e:
             messagebox.showerror("Error", str(e))
 
@@ -189,13 +332,20 @@ class App(tk.Tk):
                 params["d"] = self.widgets["d"].get()
             return params
 
-        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Array Statistics"):
+        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Top-k (Heap)", "Incremental Sort (Heap)", "Array Statistics"):
             params["array"] = parse_int_array(self.widgets["array"].get())
 
-        if name in ("Selection Sort", "Bubble Sort", "Merge Sort"):
+        if name in ("Selection Sort", "Bubble Sort", "Merge Sort", "Top-k (Heap)", "Incremental Sort (Heap)"):
             order = self.widgets["ascending"].get()
             params["ascending"] = (order == "Ascending")
 
+        if name == "Top-k (Heap)":
+            params["k"] = int(self.widgets["k"].get())
+
+        if name == "Incremental Sort (Heap)":
+            k_text = self.widgets["k"].get().strip()
+            params["k"] = int(k_text) if k_text else None
+
         if name in ("Fibonacci (DP)", "Factorial (Recursion)"):
             params["n"] = int(self.widgets["n"].get())
 
@@ -203,7 +353,7 @@ class App(tk.Tk):
             seed_text = self.widgets["seed"].get().strip()
             params["seed"] = int(seed_text) if seed_text else None
 
-        if name == "Palindrome Substrings (DP)":
+        if name in ("Palindrome Substrings (DP)", "Palindrome Analytics (Eertree)"):
             params["text"] = self.widgets["text"].get()
 
         return params
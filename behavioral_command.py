@@ -5,11 +5,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict
 
+from .algorithm_result import AlgorithmResult
 from .structural_facade import AlgorithmsFacade
 
 
 class Command:
-    def execute(self) -> str:
+    def execute(self) -> AlgorithmResult:
         raise NotImplementedError
 
 
@@ -19,5 +20,5 @@ class AlgorithmCommand(Command):
     name: str
     params: Dict[str, Any]
 
-    def execute(self) -> str:
+    def execute(self) -> AlgorithmResult:
         return self.facade.run(self.name, self.params)
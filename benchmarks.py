@@ -0,0 +1,313 @@
+"""Benchmark suite for the algorithms behind AlgorithmsFacade.
+
+Each benchmark is run over a sweep of input sizes. For every size it records
+the median and inter-quartile range of repeated timings (after warm-up runs),
+the peak memory reported by tracemalloc, and finally a fitted complexity
+exponent k for time ~ n**k. Results can be written to JSON and compared
+against a saved baseline to flag regressions.
+
+Run:
+  python performance/benchmarks.py --output bench.json
+  python performance/benchmarks.py --baseline bench.json --threshold 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Allow "python performance/benchmarks.py" from the project folder.
+sys.path.insert(0, str(Path(__file__).absolute().parent.parent))
+
+from algorithms.bubble_sort import bubble_sort, bubble_sort_fast  # noqa: E402
+from algorithms.card_shuffle import fisher_yates_shuffle, shuffle_permutations  # noqa: E402
+from algorithms.eertree import palindrome_stats  # noqa: E402
+from algorithms.factorial import factorial  # noqa: E402
+from algorithms.fibonacci_dp import fibonacci  # noqa: E402
+from algorithms.insertion_sort import insertion_sort  # noqa: E402
+from algorithms.merge_sort import merge_sort  # noqa: E402
+from algorithms.partial_sort import iter_sorted, top_k  # noqa: E402
+from algorithms.palindrome_counter import count_palindrome_substrings  # noqa: E402
+from algorithms.rsa import (  # noqa: E402
+    decrypt_blocks,
+    encrypt_message,
+    generate_keypair,
+    generate_prime,
+)
+from algorithms.selection_sort import selection_sort, selection_sort_fast  # noqa: E402
+from algorithms.stats_search import describe  # noqa: E402
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A function to time plus how to build its arguments for size n."""
+
+    name: str
+    sizes: Sequence[int]
+    setup: Callable[[int, random.Random], Tuple[Any, ...]]
+    func: Callable[..., Any]
+
+
+def _int_array(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    return ([rng.randint(0, 10 * n) for _ in range(n)],)
+
+
+def _sorted_array(n: int, _rng: random.Random) -> Tuple[Any, ...]:
+    return (list(range(n)),)
+
+
+def _nearly_sorted_array(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    a = list(range(n))
+    for _ in range(max(1, n // 50)):
+        i, j = rng.randrange(n), rng.randrange(n)
+        a[i], a[j] = a[j], a[i]
+    return (a,)
+
+
+def _top_10(arr: List[int]) -> List[int]:
+    return top_k(arr, 10)
+
+
+def _first_10(arr: List[int]) -> List[int]:
+    stream = iter_sorted(arr)
+    return [next(stream) for _ in range(min(10, len(arr)))]
+
+
+def _text(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    return ("".join(rng.choice("ab") for _ in range(n)),)
+
+
+def _deck(n: int, _rng: random.Random) -> Tuple[Any, ...]:
+    return ([f"card{i}" for i in range(n)], 0)
+
+
+def _seeded_count(n: int, _rng: random.Random) -> Tuple[Any, ...]:
+    return (n, 0)
+
+
+def _same(n: int, _rng: random.Random) -> Tuple[Any, ...]:
+    return (n,)
+
+
+# Fixed primes keep the RSA encrypt/decrypt sweeps independent of keygen.
+_RSA_KEYS = generate_keypair(p=1009, q=1013)
+
+
+def _rsa_message(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    return ("".join(chr(rng.randint(32, 126)) for _ in range(n)), _RSA_KEYS.public)
+
+
+def _rsa_blocks(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    message, public = _rsa_message(n, rng)
+    return (encrypt_message(message, public), _RSA_KEYS.private)
+
+
+def _rsa_keygen_args(n: int, rng: random.Random) -> Tuple[Any, ...]:
+    return (n, rng.getrandbits(64))
+
+
+def _rsa_keygen(bound: int, seed: int) -> Any:
+    # Size is the prime search bound: primes are drawn from [bound, 2 * bound].
+    # generate_prime uses the global RNG, so it is reseeded on every call to
+    # make each run search the same candidates.
+    random.seed(seed)
+    p = generate_prime(bound, 2 * bound)
+    q = generate_prime(bound, 2 * bound)
+    while q == p:
+        q = generate_prime(bound, 2 * bound)
+    return generate_keypair(p=p, q=q)
+
+
+BENCHMARKS: List[Benchmark] = [
+    Benchmark("selection_sort", (100, 200, 400, 800), _int_array, selection_sort),
+    Benchmark("bubble_sort", (100, 200, 400, 800), _int_array, bubble_sort),
+    Benchmark("selection_sort_fast", (100, 200, 400, 800), _int_array, selection_sort_fast),
+    Benchmark("bubble_sort_fast", (100, 200, 400, 800), _int_array, bubble_sort_fast),
+    Benchmark("insertion_sort", (100, 200, 400, 800), _int_array, insertion_sort),
+    Benchmark("bubble_sort_nearly_sorted", (100, 200, 400, 800), _nearly_sorted_array, bubble_sort),
+    Benchmark("bubble_sort_fast_nearly_sorted", (100, 200, 400, 800), _nearly_sorted_array, bubble_sort_fast),
+    Benchmark("bubble_sort_presorted", (10000, 100000), _sorted_array, bubble_sort),
+    Benchmark("bubble_sort_fast_presorted", (10000, 100000), _sorted_array, bubble_sort_fast),
+    Benchmark("selection_sort_fast_presorted", (10000, 100000), _sorted_array, selection_sort_fast),
+    Benchmark("merge_sort", (1000, 2000, 4000, 8000, 16000), _int_array, merge_sort),
+    Benchmark("top_k_10", (1000, 2000, 4000, 8000, 16000), _int_array, _top_10),
+    Benchmark("iter_sorted_first_10", (1000, 2000, 4000, 8000, 16000), _int_array, _first_10),
+    Benchmark("fibonacci", (1000, 2000, 4000, 8000, 16000), _same, fibonacci),
+    Benchmark("factorial", (100, 200, 400, 800), _same, factorial),
+    Benchmark("palindrome_count", (50, 100, 200, 400), _text, count_palindrome_substrings),
+    Benchmark("palindrome_eertree", (1000, 4000, 16000, 64000), _text, palindrome_stats),
+    Benchmark("describe", (1000, 2000, 4000, 8000, 16000), _int_array, describe),
+    Benchmark("shuffle", (52, 520, 5200, 52000), _deck, fisher_yates_shuffle),
+    Benchmark("shuffle_batch", (1000, 10000, 100000), _seeded_count, shuffle_permutations),
+    Benchmark("rsa_keygen", (1000, 10000, 100000, 1000000), _rsa_keygen_args, _rsa_keygen),
+    Benchmark("rsa_encrypt", (250, 500, 1000, 2000), _rsa_message, encrypt_message),
+    Benchmark("rsa_decrypt", (250, 500, 1000, 2000), _rsa_blocks, decrypt_blocks),
+]
+
+
+def time_runs(func: Callable[..., Any], args: Tuple[Any, ...], repeats: int, warmup: int) -> List[float]:
+    for _ in range(warmup):
+        func(*args)
+    samples: List[float] = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def peak_memory(func: Callable[..., Any], args: Tuple[Any, ...]) -> int:
+    """Peak bytes allocated during one call (measured separately from timing)."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def summarise(samples: List[float]) -> Dict[str, float]:
+    if len(samples) >= 2:
+        q1, median, q3 = statistics.quantiles(samples, n=4, method="inclusive")
+    else:
+        q1 = median = q3 = samples[0]
+    return {"median": median, "q1": q1, "q3": q3, "iqr": q3 - q1, "min": min(samples)}
+
+
+def fit_exponent(sizes: Sequence[int], times: Sequence[float]) -> Optional[float]:
+    """Least-squares slope of log(time) against log(n)."""
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    if sxx == 0:
+        return None
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    return sxy / sxx
+
+
+def run_benchmark(bench: Benchmark, repeats: int, warmup: int, seed: int, sizes: Optional[Sequence[int]] = None) -> Dict[str, Any]:
+    points: List[Dict[str, Any]] = []
+    for n in sizes or bench.sizes:
+        args = bench.setup(n, random.Random(f"{seed}:{bench.name}:{n}"))
+        stats = summarise(time_runs(bench.func, args, repeats, warmup))
+        stats["n"] = n
+        stats["peak_bytes"] = peak_memory(bench.func, args)
+        points.append(stats)
+    exponent = fit_exponent([p["n"] for p in points], [p["median"] for p in points])
+    return {"points": points, "exponent": exponent}
+
+
+def run_suite(
+    names: Optional[Sequence[str]] = None,
+    repeats: int = 7,
+    warmup: int = 1,
+    seed: int = 0,
+    quick: bool = False,
+) -> Dict[str, Any]:
+    selected = [b for b in BENCHMARKS if not names or b.name in names]
+    unknown = set(names or ()) - {b.name for b in BENCHMARKS}
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(sorted(unknown))}")
+    results: Dict[str, Any] = {}
+    for bench in selected:
+        sizes = bench.sizes[:2] if quick else bench.sizes
+        results[bench.name] = run_benchmark(bench, repeats, warmup, seed, sizes)
+    return {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeats": repeats,
+            "warmup": warmup,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """Return a message for every (benchmark, n) whose median slowed by more than threshold."""
+    regressions: List[str] = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            continue
+        base_medians = {p["n"]: p["median"] for p in base["points"]}
+        for point in result["points"]:
+            old = base_medians.get(point["n"])
+            if not old:
+                continue
+            ratio = point["median"] / old
+            if ratio > 1 + threshold:
+                regressions.append(f"{name} n={point['n']}: {old:.6f}s -> {point['median']:.6f}s (x{ratio:.2f})")
+    return regressions
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    for name, result in report["results"].items():
+        exponent = result["exponent"]
+        fitted = f"{exponent:.2f}" if exponent is not None else "n/a"
+        print(f"\n{name} (fitted exponent: {fitted})")
+        print(f"{'n':>10} {'median (s)':>12} {'IQR (s)':>12} {'peak (KiB)':>12}")
+        for p in result["points"]:
+            print(f"{p['n']:>10} {p['median']:>12.6f} {p['iqr']:>12.6f} {p['peak_bytes'] / 1024:>12.1f}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the coursework algorithms.")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="benchmarks to run (default: all)")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--quick", action="store_true", help="only run the two smallest sizes")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="JSON file from a previous run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown ratio (default 0.25 = 25%%)")
+    parser.add_argument("--list", action="store_true", help="list benchmark names and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in BENCHMARKS:
+            print(bench.name)
+        return 0
+    if args.repeats < 1:
+        parser.error("--repeats must be >= 1")
+
+    report = run_suite(args.only, repeats=args.repeats, warmup=args.warmup, seed=args.seed, quick=args.quick)
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as fh:
+            json.dump(report, fh, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fh:
+            baseline = json.load(fh)
+        regressions = compare(report, baseline, args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("\nNo regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,23 +2,82 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional
 
+from .insertion_sort import ALREADY_SORTED, USE_INSERTION, insertion_sort_inplace, sort_strategy
 
-def bubble_sort(arr: List[int], ascending: bool = True) -> List[int]:
+
+def bubble_sort(arr: List[int], ascending: bool = True, stats: Optional[Dict[str, int]] = None) -> List[int]:
+    """Sort a copy of ``arr``.
+
+    If ``stats`` is given, the number of comparisons and swaps is stored in it.
+    """
     a = arr[:]  # do not mutate input
     n = len(a)
+    comparisons = swaps = 0
     for i in range(n):
-        swapped = False
+        pass_swaps = 0
         for j in range(0, n - 1 - i):
             if ascending:
                 if a[j] > a[j + 1]:
                     a[j], a[j + 1] = a[j + 1], a[j]
-                    swapped = True
+                    pass_swaps += 1
             else:
                 if a[j] < a[j + 1]:
                     a[j], a[j + 1] = a[j + 1], a[j]
-                    swapped = True
-        if not swapped:
+                    pass_swaps += 1
+        comparisons += n - 1 - i
+        swaps += pass_swaps
+        if not pass_swaps:
             break
+    if stats is not None:
+        stats["comparisons"] = comparisons
+        stats["swaps"] = swaps
     return a
+
+
+def bubble_sort_fast(arr: List[int], ascending: bool = True) -> List[int]:
+    """Optimised bubble sort (same result as ``bubble_sort``).
+
+    Presorted input is returned after one scan; small or nearly sorted
+    inputs go to insertion sort. Otherwise a cocktail sort runs alternating
+    passes and shrinks both ends of the unsorted region to the position of
+    the last swap. Direction is handled outside the loops by sorting the
+    reversed input ascending and reversing the result.
+    """
+    a = arr[:] if ascending else arr[::-1]
+    strategy = sort_strategy(a)
+    if strategy == ALREADY_SORTED:
+        return a if ascending else arr[:]
+    if strategy == USE_INSERTION:
+        insertion_sort_inplace(a)
+    else:
+        _cocktail_sort(a)
+    if not ascending:
+        a.reverse()
+    return a
+
+
+def _cocktail_sort(a: List[int]) -> None:
+    lo, hi = 0, len(a) - 1
+    while lo < hi:
+        last = lo
+        for j in range(lo, hi):
+            x = a[j]
+            y = a[j + 1]
+            if x > y:
+                a[j] = y
+                a[j + 1] = x
+                last = j
+        hi = last  # everything after the last swap is in place
+        if lo >= hi:
+            break
+        last = hi
+        for j in range(hi, lo, -1):
+            x = a[j - 1]
+            y = a[j]
+            if x > y:
+                a[j - 1] = y
+                a[j] = x
+                last = j
+        lo = last  # everything before the last swap is in place
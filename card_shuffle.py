@@ -1,26 +1,110 @@
-"""Randomised algorithm: Fisher-Yates shuffle on a standard 52-card deck."""
+"""Randomised algorithm: Fisher-Yates shuffle on a standard 52-card deck.
+
+Seeded shuffles use their own ``random.Random`` instance, so they are
+reproducible and never touch (or depend on) the global RNG state.
+
+For bulk work (e.g. simulations) ``shuffle_permutations`` produces many
+seeded shuffles as compact index permutations: shuffle k of a batch is
+stored in ``perms[k * n:(k + 1) * n]`` as deck indices. Each permutation is
+decoded from one large random integer below n! (the factorial number
+system), so a shuffle costs a single RNG call instead of one per swap.
+An optional NumPy backend is used when requested and installed.
+"""
 
 from __future__ import annotations
 
+import math
 import random
-from typing import List
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+try:  # optional dependency, only needed for backend="numpy"
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+SUITS = ("S", "H", "D", "C")
+RANKS = ("A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K")
+
+# Built once; create_standard_deck() hands out copies.
+STANDARD_DECK: Tuple[str, ...] = tuple(f"{r}{s}" for s in SUITS for r in RANKS)
+
+
+# Unseeded shuffles share one generator; seeding a new one per call from
+# os.urandom costs more than the shuffle itself.
+_UNSEEDED = random.Random()
 
 
 def create_standard_deck() -> List[str]:
-    suits = ["S", "H", "D", "C"]
-    ranks = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
-    deck: List[str] = []
-    for s in suits:
-        for r in ranks:
-            deck.append(f"{r}{s}")
-    return deck
+    return list(STANDARD_DECK)
 
 
 def fisher_yates_shuffle(deck: List[str], seed: int | None = None) -> List[str]:
-    if seed is not None:
-        random.seed(seed)
+    """Return a shuffled copy of ``deck``.
+
+    The same seed always gives the same order (and the same order as earlier
+    versions of this function, which seeded the global RNG).
+    """
+    rng = random.Random(seed) if seed is not None else _UNSEEDED
+    randrange = rng.randrange  # same draws as randint(0, i)
     a = deck[:]
     for i in range(len(a) - 1, 0, -1):
-        j = random.randint(0, i)
+        j = randrange(i + 1)
         a[i], a[j] = a[j], a[i]
     return a
+
+
+def _decode_permutation(code: int, n: int) -> List[int]:
+    """Fisher-Yates driven by the mixed-radix digits of ``code`` (< n!)."""
+    a = list(range(n))
+    for i in range(n - 1, 0, -1):
+        code, j = divmod(code, i + 1)
+        a[i], a[j] = a[j], a[i]
+    return a
+
+
+def iter_permutations(count: int, seed: Optional[int] = None, n: int = 52) -> Iterator[List[int]]:
+    """Yield ``count`` uniformly random permutations of ``range(n)``."""
+    if count < 0:
+        raise ValueError("count must be >= 0")
+    if n < 1:
+        raise ValueError("n must be >= 1")
+    rng = random.Random(seed)
+    getrandbits = rng.getrandbits
+    limit = math.factorial(n)
+    bits = limit.bit_length()
+    for _ in range(count):
+        code = getrandbits(bits)
+        while code >= limit:  # rejection keeps every permutation equally likely
+            code = getrandbits(bits)
+        yield _decode_permutation(code, n)
+
+
+def shuffle_permutations(count: int, seed: Optional[int] = None, n: int = 52, backend: str = "python"):
+    """Generate ``count`` seeded shuffles of an n-card deck as index permutations.
+
+    With the default backend the result is a ``bytearray`` of ``count * n``
+    indices (n <= 256). With ``backend="numpy"`` it is a ``(count, n)`` uint8
+    array from ``numpy.random.default_rng(seed)``. Each backend is
+    reproducible for a given seed, but the two produce different streams.
+    """
+    if backend == "numpy":
+        if np is None:
+            raise RuntimeError("backend='numpy' requires NumPy to be installed")
+        if n > 256:
+            raise ValueError("n must be <= 256")
+        gen = np.random.default_rng(seed)
+        base = np.tile(np.arange(n, dtype=np.uint8), (count, 1))
+        return gen.permuted(base, axis=1)
+    if backend != "python":
+        raise ValueError("backend must be 'python' or 'numpy'")
+    if n > 256:
+        raise ValueError("n must be <= 256")
+    out = bytearray()
+    for perm in iter_permutations(count, seed=seed, n=n):
+        out += bytes(perm)
+    return out
+
+
+def deal(permutation: Sequence[int], deck: Sequence[str] = STANDARD_DECK) -> List[str]:
+    """Map an index permutation back to card names."""
+    return [deck[i] for i in permutation]
@@ -0,0 +1,118 @@
+"""Palindromic substring analytics with an eertree (palindromic tree).
+
+The eertree has one node per distinct palindrome in the text, linked to its
+longest proper palindromic suffix. Adding a character creates at most one
+node, so building it is O(n) amortised and text can be appended
+incrementally: only the new characters are processed.
+
+For every prefix it tracks
+- ``total``: palindromic substrings counted by position (the same number
+  as ``count_palindrome_substrings``), and
+- ``distinct``: different palindromic strings.
+
+``analyse_lines`` / ``analyse_file`` run the analysis over many lines,
+optionally across a process pool.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
+
+
+class Eertree:
+    def __init__(self, text: str = "") -> None:
+        # Node 0 is the imaginary root of length -1, node 1 the empty palindrome.
+        self._len: List[int] = [-1, 0]
+        self._link: List[int] = [0, 0]
+        self._next: List[Dict[str, int]] = [{}, {}]
+        # Number of non-empty palindromic suffixes of each node's palindrome.
+        self._depth: List[int] = [0, 0]
+        self._text: List[str] = []
+        self._last = 1
+        self.total = 0
+        if text:
+            self.extend(text)
+
+    def __len__(self) -> int:
+        return len(self._text)
+
+    @property
+    def distinct(self) -> int:
+        return len(self._len) - 2
+
+    def _suffix_for(self, node: int, i: int, ch: str) -> int:
+        # Longest palindromic suffix X of node such that ch + X + ch ends at i.
+        s = self._text
+        lengths = self._len
+        while True:
+            start = i - 1 - lengths[node]
+            if start >= 0 and s[start] == ch:
+                return node
+            node = self._link[node]
+
+    def append(self, ch: str) -> None:
+        i = len(self._text)
+        self._text.append(ch)
+        cur = self._suffix_for(self._last, i, ch)
+        node = self._next[cur].get(ch)
+        if node is None:
+            length = self._len[cur] + 2
+            if length == 1:
+                link = 1
+            else:
+                link = self._next[self._suffix_for(self._link[cur], i, ch)][ch]
+            node = len(self._len)
+            self._len.append(length)
+            self._link.append(link)
+            self._next.append({})
+            self._depth.append(self._depth[link] + 1)
+            self._next[cur][ch] = node
+        self._last = node
+        self.total += self._depth[node]
+
+    def extend(self, text: str) -> None:
+        for ch in text:
+            self.append(ch)
+
+
+@dataclass(frozen=True)
+class PalindromeStats:
+    length: int
+    total: int
+    distinct: int
+
+
+def palindrome_stats(s: str) -> PalindromeStats:
+    tree = Eertree(s)
+    return PalindromeStats(length=len(s), total=tree.total, distinct=tree.distinct)
+
+
+def analyse_lines(lines: Iterable[str], workers: int = 1, chunksize: int = 64) -> Iterator[PalindromeStats]:
+    """Yield stats for each line, in input order.
+
+    With ``workers > 1`` lines are processed in a process pool; input is read
+    in slabs so that huge inputs are never held in memory all at once.
+    """
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+    if workers == 1:
+        for line in lines:
+            yield palindrome_stats(line)
+        return
+    it = iter(lines)
+    slab = workers * chunksize * 4
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            batch = list(islice(it, slab))
+            if not batch:
+                break
+            yield from executor.map(palindrome_stats, batch, chunksize=chunksize)
+
+
+def analyse_file(path: str, workers: int = 1, encoding: str = "utf-8", chunksize: int = 64) -> Iterator[PalindromeStats]:
+    """Yield stats for each line of a text file (line endings excluded)."""
+    with open(path, encoding=encoding) as fh:
+        yield from analyse_lines((line.rstrip("\r\n") for line in fh), workers=workers, chunksize=chunksize)
@@ -0,0 +1,75 @@
+"""Insertion sort from scratch, plus the helpers used by the adaptive sorts.
+
+Insertion sort does O(n + inversions) work, so it is the fastest of the
+quadratic sorts on small or nearly sorted inputs and never does more
+comparisons than bubble sort or selection sort.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import List
+
+# Inputs this short are always handed to insertion sort.
+INSERTION_CUTOFF = 16
+
+# Results of sort_strategy().
+ALREADY_SORTED = 0
+USE_INSERTION = 1
+USE_FULL_SORT = 2
+
+
+def insertion_sort(arr: List[int], ascending: bool = True) -> List[int]:
+    # Sorting the reversed input ascending and reversing back gives a stable
+    # descending sort and keeps nearly-descending input cheap.
+    a = arr[:] if ascending else arr[::-1]
+    insertion_sort_inplace(a)
+    if not ascending:
+        a.reverse()
+    return a
+
+
+def insertion_sort_inplace(a: List[int]) -> None:
+    """Sort ``a`` ascending in place."""
+    for i in range(1, len(a)):
+        x = a[i]
+        j = i - 1
+        while j >= 0 and a[j] > x:
+            a[j + 1] = a[j]
+            j -= 1
+        a[j + 1] = x
+
+
+def count_descents(a: List[int], limit: int) -> int:
+    """Number of positions with a[i] > a[i + 1].
+
+    Scanning stops once the count exceeds ``limit``, so the result is exact
+    only up to ``limit + 1``.
+    """
+    descents = 0
+    for x, y in zip(a, islice(a, 1, None)):
+        if x > y:
+            descents += 1
+            if descents > limit:
+                break
+    return descents
+
+
+def is_nearly_sorted(a: List[int], max_descents: int) -> bool:
+    """True if ``a`` has at most ``max_descents`` positions with a[i] > a[i + 1]."""
+    return count_descents(a, max_descents) <= max_descents
+
+
+def sort_strategy(a: List[int]) -> int:
+    """Pick how the adaptive sorts should handle ``a`` with a single scan.
+
+    ALREADY_SORTED needs no work, USE_INSERTION means the input is small or
+    has few descents (at most n // 8), USE_FULL_SORT means anything else.
+    """
+    n = len(a)
+    descents = count_descents(a, n // 8)
+    if descents == 0:
+        return ALREADY_SORTED
+    if n <= INSERTION_CUTOFF or descents <= n // 8:
+        return USE_INSERTION
+    return USE_FULL_SORT
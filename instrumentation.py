@@ -0,0 +1,108 @@
+"""Opt-in instrumentation for the Command/Facade pipeline.
+
+A MetricsRegistry collects per-stage timings (parsing, facade dispatch, the
+algorithm itself, result formatting) and counters reported by the algorithms
+(comparisons/swaps, modexp calls, memo size). It is disabled by default: in
+that state ``stage()`` hands back a shared no-op context manager and callers
+skip counter collection, so the pipeline pays only an attribute check.
+
+``profile_command`` runs a single command under cProfile on demand.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import time
+from contextlib import nullcontext
+from typing import TYPE_CHECKING, Any, ContextManager, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from .algorithm_result import AlgorithmResult
+    from .behavioral_command import Command
+
+_NULL_STAGE = nullcontext()
+
+
+class _Stage:
+    __slots__ = ("registry", "name", "start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str) -> None:
+        self.registry = registry
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> "_Stage":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.registry.record(self.name, time.perf_counter() - self.start)
+
+
+class MetricsRegistry:
+    """In-memory timings and counters, keyed by name."""
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        # name -> [count, total, min, max] (seconds)
+        self._timings: Dict[str, List[float]] = {}
+        self._counters: Dict[str, int] = {}
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def stage(self, name: str) -> ContextManager[Any]:
+        """Time the enclosed block under ``name`` (no-op when disabled)."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        entry = self._timings.get(name)
+        if entry is None:
+            self._timings[name] = [1, seconds, seconds, seconds]
+            return
+        entry[0] += 1
+        entry[1] += seconds
+        if seconds < entry[2]:
+            entry[2] = seconds
+        if seconds > entry[3]:
+            entry[3] = seconds
+
+    def incr(self, name: str, amount: int = 1) -> None:
+        self._counters[name] = self._counters.get(name, 0) + amount
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        timings = {
+            name: {"count": int(c), "total": total, "mean": total / c, "min": lo, "max": hi}
+            for name, (c, total, lo, hi) in self._timings.items()
+        }
+        return {"timings": timings, "counters": dict(self._counters)}
+
+    def reset(self) -> None:
+        self._timings.clear()
+        self._counters.clear()
+
+
+# Registry used by the facade and the GUI unless another one is supplied.
+METRICS = MetricsRegistry()
+
+
+def profile_command(command: "Command", sort_by: str = "cumulative", limit: int = 25) -> Tuple["AlgorithmResult", str]:
+    """Execute ``command`` under cProfile; return its result and the stats report."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        result = command.execute()
+        # Include formatting, which otherwise happens lazily later.
+        result.text()
+    finally:
+        profiler.disable()
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats(sort_by).print_stats(limit)
+    return result, out.getvalue()
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional
 
 
-def merge_sort(arr: List[int], ascending: bool = True) -> List[int]:
+def merge_sort(arr: List[int], ascending: bool = True, stats: Optional[Dict[str, int]] = None) -> List[int]:
+    """Sort a copy of ``arr``.
+
+    If ``stats`` is given, the number of comparisons is added to
+    ``stats["comparisons"]``.
+    """
     a = arr[:]
     if len(a) <= 1:
         return a
     mid = len(a) // 2
-    left = merge_sort(a[:mid], ascending=ascending)
-    right = merge_sort(a[mid:], ascending=ascending)
-    return _merge(left, right, ascending=ascending)
+    left = merge_sort(a[:mid], ascending=ascending, stats=stats)
+    right = merge_sort(a[mid:], ascending=ascending, stats=stats)
+    return _merge(left, right, ascending=ascending, stats=stats)
 
 
-def _merge(left: List[int], right: List[int], ascending: bool) -> List[int]:
+def _merge(left: List[int], right: List[int], ascending: bool, stats: Optional[Dict[str, int]] = None) -> List[int]:
     merged: List[int] = []
     i = j = 0
     while i < len(left) and j < len(right):
@@ -33,6 +38,9 @@ def _merge(left: List[int], right: List[int], ascending: bool) -> List[int]:
             else:
                 merged.append(right[j])
                 j += 1
+    if stats is not None:
+        # one comparison per element taken inside the loop
+        stats["comparisons"] = stats.get("comparisons", 0) + i + j
     merged.extend(left[i:])
     merged.extend(right[j:])
     return merged
@@ -0,0 +1,169 @@
+"""Monte Carlo estimation of deal probabilities using shuffled decks.
+
+Trials are split into fixed-size batches. Batch k always draws its shuffles
+from a seed derived from (seed, k), so results are reproducible and do not
+depend on how many worker processes ran the batches. Batches are merged in
+order, giving a running estimate with a Wilson score confidence interval;
+``simulate`` can stop as soon as that interval is narrow enough.
+
+The predicate receives the dealt cards (e.g. ``["QD", "JC", ...]``) and must
+be a module-level function so it can be sent to worker processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from statistics import NormalDist
+from typing import Callable, Deque, Iterator, List, Optional, Tuple
+
+from .card_shuffle import STANDARD_DECK, deal, iter_permutations
+
+Predicate = Callable[[List[str]], bool]
+
+
+@dataclass(frozen=True)
+class Estimate:
+    trials: int
+    hits: int
+    confidence: float
+    low: float
+    high: float
+    target_reached: bool = False
+
+    @property
+    def probability(self) -> float:
+        return self.hits / self.trials if self.trials else 0.0
+
+    @property
+    def half_width(self) -> float:
+        return (self.high - self.low) / 2
+
+
+def wilson_interval(hits: int, trials: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if trials <= 0:
+        return (0.0, 1.0)
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    p = hits / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    margin = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return (max(0.0, centre - margin), min(1.0, centre + margin))
+
+
+def batch_seed(seed: int, index: int) -> int:
+    """Seed for batch ``index``: independent of the worker that runs it."""
+    digest = hashlib.sha256(f"{seed}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def run_batch(predicate: Predicate, seed: int, index: int, size: int) -> int:
+    """Count the shuffles in one batch for which ``predicate`` holds."""
+    hits = 0
+    for perm in iter_permutations(size, seed=batch_seed(seed, index), n=len(STANDARD_DECK)):
+        if predicate(deal(perm)):
+            hits += 1
+    return hits
+
+
+def _batch_sizes(max_trials: int, batch_size: int) -> Iterator[int]:
+    remaining = max_trials
+    while remaining > 0:
+        size = min(batch_size, remaining)
+        yield size
+        remaining -= size
+
+
+def iter_estimates(
+    predicate: Predicate,
+    max_trials: int,
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = 10000,
+    confidence: float = 0.95,
+) -> Iterator[Estimate]:
+    """Yield the running estimate after each completed batch.
+
+    With ``workers > 1`` batches run in a process pool, at most ``2 * workers``
+    ahead of the one being merged. Closing the generator cancels the rest.
+    """
+    if max_trials < 1:
+        raise ValueError("max_trials must be >= 1")
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+    if workers < 1:
+        raise ValueError("workers must be >= 1")
+
+    trials = hits = 0
+    sizes = enumerate(_batch_sizes(max_trials, batch_size))
+
+    if workers == 1:
+        for index, size in sizes:
+            hits += run_batch(predicate, seed, index, size)
+            trials += size
+            yield Estimate(trials, hits, confidence, *wilson_interval(hits, trials, confidence))
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: Deque[Tuple[int, Future]] = deque()
+    try:
+        for index, size in sizes:
+            pending.append((size, executor.submit(run_batch, predicate, seed, index, size)))
+            if len(pending) < 2 * workers:
+                continue
+            size, future = pending.popleft()
+            hits += future.result()
+            trials += size
+            yield Estimate(trials, hits, confidence, *wilson_interval(hits, trials, confidence))
+        while pending:
+            size, future = pending.popleft()
+            hits += future.result()
+            trials += size
+            yield Estimate(trials, hits, confidence, *wilson_interval(hits, trials, confidence))
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def simulate(
+    predicate: Predicate,
+    max_trials: int,
+    seed: int = 0,
+    workers: int = 1,
+    batch_size: int = 10000,
+    confidence: float = 0.95,
+    target_half_width: Optional[float] = None,
+    on_progress: Optional[Callable[[Estimate], None]] = None,
+) -> Estimate:
+    """Estimate P(predicate) over up to ``max_trials`` shuffled decks.
+
+    Stops early once the confidence interval half-width is at most
+    ``target_half_width``; the returned estimate then has ``target_reached``.
+    """
+    estimates = iter_estimates(predicate, max_trials, seed, workers, batch_size, confidence)
+    last: Optional[Estimate] = None
+    try:
+        for last in estimates:
+            if on_progress is not None:
+                on_progress(last)
+            if target_half_width is not None and last.half_width <= target_half_width:
+                return Estimate(last.trials, last.hits, confidence, last.low, last.high, target_reached=True)
+    finally:
+        estimates.close()
+    assert last is not None
+    return last
+
+
+def first_card_is_ace(cards: List[str]) -> bool:
+    """Example predicate: the top card is an ace (p = 1/13)."""
+    return cards[0][0] == "A"
+
+
+def first_two_cards_pair(cards: List[str]) -> bool:
+    """Example predicate: the first two cards share a rank (p = 1/17)."""
+    return cards[0][:-1] == cards[1][:-1]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 
 
-def count_palindrome_substrings(s: str) -> int:
+def count_palindrome_substrings(s: str, stats: Optional[Dict[str, int]] = None) -> int:
+    """Count palindromic substrings of ``s``.
+
+    If ``stats`` is given, the final memo size is stored in ``stats["memo_size"]``.
+    """
     n = len(s)
     memo: Dict[Tuple[int, int], bool] = {}
 
@@ -26,4 +30,6 @@ def count_palindrome_substrings(s: str) -> int:
         for j in range(i, n):
             if is_pal(i, j):
                 count += 1
+    if stats is not None:
+        stats["memo_size"] = len(memo)
     return count
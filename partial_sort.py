@@ -0,0 +1,64 @@
+"""Partial and incremental sorting with a binary heap.
+
+- ``top_k`` keeps a heap of the best k values seen so far: O(n log k).
+- ``iter_sorted`` heapifies once (O(n)) and then pops one value per step
+  (O(log n)), so the first results are available long before a full sort
+  would finish. ``first_k`` collects the first k values from it.
+"""
+
+from __future__ import annotations
+
+import heapq
+from itertools import islice
+from typing import Iterator, List, Optional
+
+
+def top_k(arr: List[int], k: int, ascending: bool = True) -> List[int]:
+    """The k smallest (ascending) or k largest (descending) values, in order."""
+    _check_k(k)
+    if k == 0:
+        return []
+    if k >= len(arr):
+        return sorted(arr, reverse=not ascending)
+    if ascending:
+        # max-heap of the k smallest values, stored negated
+        heap = [-x for x in arr[:k]]
+        heapq.heapify(heap)
+        for x in arr[k:]:
+            if -x > heap[0]:
+                heapq.heapreplace(heap, -x)
+        return sorted(-x for x in heap)
+    heap = arr[:k]
+    heapq.heapify(heap)
+    for x in arr[k:]:
+        if x > heap[0]:
+            heapq.heapreplace(heap, x)
+    return sorted(heap, reverse=True)
+
+
+def first_k(arr: List[int], k: Optional[int] = None, ascending: bool = True) -> List[int]:
+    """The first k values of ``iter_sorted``; k=None returns them all."""
+    stream = iter_sorted(arr, ascending=ascending)
+    if k is None:
+        return list(stream)
+    _check_k(k)
+    return list(islice(stream, k))
+
+
+def _check_k(k: int) -> None:
+    if k < 0:
+        raise ValueError("k must be >= 0")
+
+
+def iter_sorted(arr: List[int], ascending: bool = True) -> Iterator[int]:
+    """Lazily yield the values of ``arr`` in sorted order."""
+    if ascending:
+        heap = arr[:]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)
+    else:
+        heap = [-x for x in arr]
+        heapq.heapify(heap)
+        while heap:
+            yield -heapq.heappop(heap)
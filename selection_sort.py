@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import Dict, List, Optional
 
+from .insertion_sort import ALREADY_SORTED, USE_INSERTION, insertion_sort_inplace, sort_strategy
 
-def selection_sort(arr: List[int], ascending: bool = True) -> List[int]:
+
+def selection_sort(arr: List[int], ascending: bool = True, stats: Optional[Dict[str, int]] = None) -> List[int]:
+    """Sort a copy of ``arr``.
+
+    If ``stats`` is given, the number of comparisons and swaps is stored in it.
+    """
     a = arr[:]  # do not mutate input
     n = len(a)
+    swaps = 0
     for i in range(n):
         best_idx = i
         for j in range(i + 1, n):
@@ -17,5 +24,53 @@ def selection_sort(arr: List[int], ascending: bool = True) -> List[int]:
             else:
                 if a[j] > a[best_idx]:
                     best_idx = j
-        a[i], a[best_idx] = a[best_idx], a[i]
+        if best_idx != i:
+            a[i], a[best_idx] = a[best_idx], a[i]
+            swaps += 1
+    if stats is not None:
+        stats["comparisons"] = n * (n - 1) // 2
+        stats["swaps"] = swaps
+    return a
+
+
+def selection_sort_fast(arr: List[int], ascending: bool = True) -> List[int]:
+    """Optimised selection sort (same result as ``selection_sort``).
+
+    Presorted input is returned after one scan; small or nearly sorted
+    inputs go to insertion sort. Otherwise each pass selects both the
+    minimum and the maximum of the unsorted middle and places them at its
+    two ends, halving the number of passes. Descending order reverses the
+    ascending result.
+    """
+    a = arr[:] if ascending else arr[::-1]
+    strategy = sort_strategy(a)
+    if strategy == ALREADY_SORTED:
+        return a if ascending else arr[:]
+    if strategy == USE_INSERTION:
+        insertion_sort_inplace(a)
+    else:
+        _double_selection_sort(a)
+    if not ascending:
+        a.reverse()
     return a
+
+
+def _double_selection_sort(a: List[int]) -> None:
+    lo, hi = 0, len(a) - 1
+    while lo < hi:
+        min_idx = max_idx = lo
+        min_val = max_val = a[lo]
+        for j in range(lo + 1, hi + 1):
+            v = a[j]
+            if v < min_val:
+                min_val = v
+                min_idx = j
+            elif v > max_val:
+                max_val = v
+                max_idx = j
+        a[lo], a[min_idx] = a[min_idx], a[lo]
+        if max_idx == lo:  # the maximum was just moved to min_idx
+            max_idx = min_idx
+        a[hi], a[max_idx] = a[max_idx], a[hi]
+        lo += 1
+        hi -= 1
@@ -1,11 +1,12 @@
 """Structural Design Pattern: Facade.
 
-Provides a single interface to many algorithm modules.
+Provides a single interface to many algorithm modules. Each call returns an
+AlgorithmResult holding the raw value; text is only built when displayed.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from algorithms.rsa import (
     PrivateKey,
@@ -19,52 +20,122 @@ from algorithms.fibonacci_dp import fibonacci
 from algorithms.selection_sort import selection_sort
 from algorithms.bubble_sort import bubble_sort
 from algorithms.merge_sort import merge_sort
+from algorithms.partial_sort import first_k, top_k
 from algorithms.card_shuffle import create_standard_deck, fisher_yates_shuffle
 from algorithms.factorial import factorial
 from algorithms.stats_search import describe
 from algorithms.palindrome_counter import count_palindrome_substrings
+from algorithms.eertree import palindrome_stats
+
+from .algorithm_result import AlgorithmResult
+from .instrumentation import METRICS, MetricsRegistry
 
 
 class AlgorithmsFacade:
-    def run(self, name: str, params: Dict[str, Any]) -> str:
+    def __init__(self, metrics: Optional[MetricsRegistry] = None) -> None:
+        self.metrics = metrics if metrics is not None else METRICS
+
+    def run(self, name: str, params: Dict[str, Any]) -> AlgorithmResult:
         name = name.strip()
+        metrics = self.metrics
+        if not metrics.enabled:
+            return self._dispatch(name, params, None)
+        counters: Dict[str, int] = {}
+        with metrics.stage("facade.run"):
+            result = self._dispatch(name, params, counters)
+        metrics.incr(f"{name}.calls")
+        for key, value in counters.items():
+            metrics.incr(f"{name}.{key}", value)
+        result.metrics = metrics
+        return result
+
+    def _dispatch(self, name: str, params: Dict[str, Any], counters: Optional[Dict[str, int]]) -> AlgorithmResult:
+        stage = self.metrics.stage(f"algorithm.{name}")
         if name == "RSA Encrypt/Decrypt":
-            return self._run_rsa(params)
+            return self._run_rsa(params, counters)
         if name == "Fibonacci (DP)":
             n = int(params["n"])
-            return f"Fibonacci({n}) = {fibonacci(n)}"
+            with stage:
+                value = fibonacci(n)
+            return AlgorithmResult(name, value, lambda fmt: f"Fibonacci({n}) = {fmt(value)}")
         if name == "Selection Sort":
-            return f"Sorted: {selection_sort(params['array'], ascending=params.get('ascending', True))}"
+            with stage:
+                value = selection_sort(params['array'], ascending=params.get('ascending', True), stats=counters)
+            return AlgorithmResult(name, value, lambda fmt: f"Sorted: {fmt(value)}")
         if name == "Bubble Sort":
-            return f"Sorted: {bubble_sort(params['array'], ascending=params.get('ascending', True))}"
+            with stage:
+                value = bubble_sort(params['array'], ascending=params.get('ascending', True), stats=counters)
+            return AlgorithmResult(name, value, lambda fmt: f"Sorted: {fmt(value)}")
         if name == "Merge Sort":
-            return f"Sorted: {merge_sort(params['array'], ascending=params.get('ascending', True))}"
+            with stage:
+                value = merge_sort(params['array'], ascending=params.get('ascending', True), stats=counters)
+            return AlgorithmResult(name, value, lambda fmt: f"Sorted: {fmt(value)}")
+        if name == "Top-k (Heap)":
+            k = int(params['k'])
+            ascending = params.get('ascending', True)
+            with stage:
+                value = top_k(params['array'], k, ascending=ascending)
+            label = "Smallest" if ascending else "Largest"
+            return AlgorithmResult(name, value, lambda fmt: f"{label} {k}: {fmt(value)}")
+        if name == "Incremental Sort (Heap)":
+            # Only the first k values are produced; k=None sorts everything.
+            k = params.get('k')
+            k = int(k) if k is not None else None
+            with stage:
+                value = first_k(params['array'], k, ascending=params.get('ascending', True))
+            return AlgorithmResult(name, value, lambda fmt: f"First {len(value)} sorted: {fmt(value)}")
         if name == "Shuffle Deck":
             seed = params.get('seed')
             deck = create_standard_deck()
-            shuffled = fisher_yates_shuffle(deck, seed=seed)
-            return "Shuffled deck order:\n" + ", ".join(shuffled)
+            with stage:
+                shuffled = fisher_yates_shuffle(deck, seed=seed)
+            return AlgorithmResult(name, shuffled, lambda fmt: "Shuffled deck order:\n" + fmt(shuffled, sep=", "))
         if name == "Factorial (Recursion)":
             n = int(params['n'])
-            return f"{n}! = {factorial(n)}"
+            with stage:
+                value = factorial(n)
+            return AlgorithmResult(name, value, lambda fmt: f"{n}! = {fmt(value)}")
         if name == "Array Statistics":
-            stats = describe(params['array'])
-            return (
-                "Statistics (from scratch):\n"
-                f"Sorted: {stats['sorted']}\n"
-                f"Smallest: {stats['smallest']}\n"
-                f"Largest: {stats['largest']}\n"
-                f"Mode(s): {stats['mode']} (count={stats['mode_count']})\n"
-                f"Median: {stats['median']}\n"
-                f"Q1: {stats['q1']}\n"
-                f"Q3: {stats['q3']}"
+            with stage:
+                stats = describe(params['array'])
+            return AlgorithmResult(
+                name,
+                stats,
+                lambda fmt: (
+                    "Statistics (from scratch):\n"
+                    f"Sorted: {fmt(stats['sorted'])}\n"
+                    f"Smallest: {stats['smallest']}\n"
+                    f"Largest: {stats['largest']}\n"
+                    f"Mode(s): {fmt(stats['mode'])} (count={stats['mode_count']})\n"
+                    f"Median: {stats['median']}\n"
+                    f"Q1: {stats['q1']}\n"
+                    f"Q3: {stats['q3']}"
+                ),
             )
         if name == "Palindrome Substrings (DP)":
             s = str(params['text'])
-            return f"Number of palindromic substrings in '{s}': {count_palindrome_substrings(s)}"
+            with stage:
+                value = count_palindrome_substrings(s, stats=counters)
+            return AlgorithmResult(
+                name, value, lambda fmt: f"Number of palindromic substrings in '{fmt(s)}': {fmt(value)}"
+            )
+        if name == "Palindrome Analytics (Eertree)":
+            s = str(params['text'])
+            with stage:
+                value = palindrome_stats(s)
+            return AlgorithmResult(
+                name,
+                value,
+                lambda fmt: (
+                    f"Palindromic substrings in '{fmt(s)}': {fmt(value.total)}\n"
+                    f"Distinct palindromes: {fmt(value.distinct)}"
+                ),
+            )
         raise ValueError(f"Unknown algorithm: {name}")
 
-    def _run_rsa(self, params: Dict[str, Any]) -> str:
+    def _run_rsa(self, params: Dict[str, Any], counters: Optional[Dict[str, int]] = None) -> AlgorithmResult:
+        name = "RSA Encrypt/Decrypt"
+        stage = self.metrics.stage(f"algorithm.{name}")
         mode = params.get('mode', 'encrypt')
         if mode == 'encrypt':
             message = str(params.get('message', ''))
@@ -74,15 +145,23 @@ class AlgorithmsFacade:
             p_int = int(p) if p not in (None, '') else None
             q_int = int(q) if q not in (None, '') else None
             e_int = int(e) if e not in (None, '') else None
-            kp = generate_keypair(p=p_int, q=q_int, e=e_int)
-            blocks = encrypt_message(message, kp.public)
-            return (
-                "RSA Encryption Result:\n"
-                f"Public key (n, e): ({kp.public.n}, {kp.public.e})\n"
-                f"Private key (n, d): ({kp.private.n}, {kp.private.d})\n"
-                "Ciphertext blocks:\n"
-                f"{format_ciphertext(blocks)}\n\n"
-                "Tip: copy ciphertext blocks and decrypt using (n, d)."
+            with stage:
+                kp = generate_keypair(p=p_int, q=q_int, e=e_int)
+                blocks = encrypt_message(message, kp.public)
+            if counters is not None:
+                counters["modexp_calls"] = len(blocks)  # one per block
+            return AlgorithmResult(
+                name,
+                {"keypair": kp, "ciphertext": blocks},
+                lambda fmt: (
+                    "RSA Encryption Result:\n"
+                    f"Public key (n, e): ({kp.public.n}, {kp.public.e})\n"
+                    f"Private key (n, d): ({kp.private.n}, {kp.private.d})\n"
+                    "Ciphertext blocks:\n"
+                    # never abbreviated: users paste the blocks back into decrypt
+                    f"{format_ciphertext(blocks)}\n\n"
+                    "Tip: copy ciphertext blocks and decrypt using (n, d)."
+                ),
             )
         if mode == 'decrypt':
             ciphertext = str(params.get('ciphertext', ''))
@@ -91,6 +170,9 @@ class AlgorithmsFacade:
             if n in (None, '') or d in (None, ''):
                 raise ValueError('To decrypt, please provide n and d.')
             blocks = parse_ciphertext(ciphertext)
-            plaintext = decrypt_blocks(blocks, PrivateKey(n=int(n), d=int(d)))
-            return "RSA Decryption Result:\n" + plaintext
+            with stage:
+                plaintext = decrypt_blocks(blocks, PrivateKey(n=int(n), d=int(d)))
+            if counters is not None:
+                counters["modexp_calls"] = len(blocks)
+            return AlgorithmResult(name, plaintext, lambda fmt: "RSA Decryption Result:\n" + fmt(plaintext))
         raise ValueError('mode must be encrypt or decrypt')
@@ -1,14 +1,31 @@
+import os
+import random
+import tempfile
 import unittest
 
 from algorithms.fibonacci_dp import fibonacci
 from algorithms.factorial import factorial
-from algorithms.selection_sort import selection_sort
-from algorithms.bubble_sort import bubble_sort
+from algorithms.selection_sort import selection_sort, selection_sort_fast
+from algorithms.bubble_sort import bubble_sort, bubble_sort_fast
+from algorithms.insertion_sort import (
+    ALREADY_SORTED,
+    USE_FULL_SORT,
+    count_descents,
+    insertion_sort,
+    sort_strategy,
+)
 from algorithms.merge_sort import merge_sort
+from algorithms.partial_sort import first_k, iter_sorted, top_k
 from algorithms.stats_search import describe
 from algorithms.palindrome_counter import count_palindrome_substrings
-from algorithms.card_shuffle import create_standard_deck, fisher_yates_shuffle
+from algorithms.eertree import Eertree, analyse_file, analyse_lines
+from algorithms.card_shuffle import create_standard_deck, deal, fisher_yates_shuffle, shuffle_permutations
+from algorithms.monte_carlo import first_card_is_ace, simulate, wilson_interval
 from algorithms.rsa import generate_keypair, encrypt_message, decrypt_blocks
+from patterns.algorithm_result import format_value
+from patterns.behavioral_command import AlgorithmCommand
+from patterns.instrumentation import MetricsRegistry, profile_command
+from patterns.structural_facade import AlgorithmsFacade
 
 
 class TestAlgorithms(unittest.TestCase):
@@ -27,6 +44,55 @@ class TestAlgorithms(unittest.TestCase):
         self.assertEqual(bubble_sort(data, ascending=False), [9, 3, 2, 1])
         self.assertEqual(merge_sort(data), [1, 2, 3, 9])
 
+    def test_fast_sorts(self):
+        rng = random.Random(0)
+        nearly = list(range(200))
+        nearly[10], nearly[150] = nearly[150], nearly[10]
+        cases = [[], [1], [2, 1], [5, 5, 1], list(range(100)), list(range(100, 0, -1)), nearly]
+        cases += [[rng.randint(0, 50) for _ in range(n)] for n in (3, 17, 64, 257)]
+        for fn in (bubble_sort_fast, selection_sort_fast, insertion_sort):
+            for data in cases:
+                original = data[:]
+                self.assertEqual(fn(data), sorted(data))
+                self.assertEqual(fn(data, ascending=False), sorted(data, reverse=True))
+                self.assertEqual(data, original)
+
+    def test_fast_sorts_presorted(self):
+        data = list(range(-500, 500)) + [500] * 10
+        for fn in (bubble_sort_fast, selection_sort_fast):
+            self.assertEqual(fn(data), data)
+            self.assertEqual(fn(data[::-1], ascending=False), data[::-1])
+            self.assertIsNot(fn(data), data)
+        self.assertEqual(count_descents(data, 0), 0)
+        self.assertEqual(sort_strategy(data), ALREADY_SORTED)
+        self.assertEqual(sort_strategy(data[::-1]), USE_FULL_SORT)
+        self.assertEqual(count_descents([3, 2, 1, 0], 1), 2)  # stops past the limit
+
+    def test_partial_sort(self):
+        rng = random.Random(1)
+        data = [rng.randint(-100, 100) for _ in range(500)]
+        self.assertGreater(len(set(data)), 100)
+        self.assertLess(len(set(data)), len(data))  # duplicates present
+        self.assertEqual(top_k(data, 10), sorted(data)[:10])
+        self.assertEqual(top_k(data, 10, ascending=False), sorted(data, reverse=True)[:10])
+        self.assertEqual(top_k(data, 0), [])
+        self.assertEqual(top_k([3, 1], 5), [1, 3])
+        self.assertEqual(list(iter_sorted(data)), sorted(data))
+        self.assertEqual(list(iter_sorted(data, ascending=False)), sorted(data, reverse=True))
+        self.assertEqual(first_k(data, 7, ascending=False), sorted(data, reverse=True)[:7])
+        self.assertEqual(first_k(data), sorted(data))
+        with self.assertRaisesRegex(ValueError, "k must be >= 0"):
+            top_k(data, -1)
+
+        facade = AlgorithmsFacade()
+        result = facade.run("Top-k (Heap)", {"array": [5, 1, 4, 2], "k": 2, "ascending": False})
+        self.assertEqual(str(result), "Largest 2: [5, 4]")
+        result = facade.run("Incremental Sort (Heap)", {"array": [5, 1, 4, 2], "k": 3})
+        self.assertEqual(result.value, [1, 2, 4])
+        for name in ("Top-k (Heap)", "Incremental Sort (Heap)"):
+            with self.assertRaisesRegex(ValueError, "k must be >= 0"):
+                facade.run(name, {"array": [1, 2], "k": -1})
+
     def test_stats(self):
         stats = describe([1, 2, 2, 3, 4])
         self.assertEqual(stats["smallest"], 1)
@@ -38,11 +104,68 @@ class TestAlgorithms(unittest.TestCase):
         self.assertEqual(count_palindrome_substrings("aaa"), 6)
         self.assertEqual(count_palindrome_substrings("abc"), 3)
 
+    def test_eertree(self):
+        rng = random.Random(2)
+        for _ in range(20):
+            text = "".join(rng.choice("abc") for _ in range(rng.randint(0, 40)))
+            tree = Eertree(text)
+            self.assertEqual(tree.total, count_palindrome_substrings(text))
+            distinct = {text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1) if text[i:j] == text[i:j][::-1]}
+            self.assertEqual(tree.distinct, len(distinct))
+
+        tree = Eertree("aa")
+        tree.extend("a")
+        self.assertEqual((tree.total, tree.distinct, len(tree)), (6, 3, 3))
+
+        lines = ["abba", "", "racecar"] * 50
+        serial = list(analyse_lines(lines))
+        self.assertEqual([s.total for s in serial[:3]], [6, 0, 10])
+        self.assertEqual(list(analyse_lines(lines, workers=2, chunksize=4)), serial)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "lines.txt")
+            with open(path, "w", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+            self.assertEqual(list(analyse_file(path)), serial)
+
+        text = "ab" * 100000
+        result = AlgorithmsFacade().run("Palindrome Analytics (Eertree)", {"text": text})
+        self.assertEqual(result.value.length, len(text))
+        self.assertLess(len(result.preview()), 1200)
+        self.assertIn(text, result.text())
+
     def test_shuffle(self):
         deck = create_standard_deck()
         shuffled = fisher_yates_shuffle(deck, seed=123)
         self.assertEqual(len(shuffled), 52)
         self.assertEqual(sorted(shuffled), sorted(deck))
+        self.assertEqual(fisher_yates_shuffle(deck, seed=123), shuffled)
+        self.assertEqual(shuffled[:4], ["QD", "JC", "4D", "10C"])
+
+    def test_shuffle_batch(self):
+        perms = shuffle_permutations(100, seed=7)
+        self.assertEqual(len(perms), 100 * 52)
+        self.assertEqual(perms, shuffle_permutations(100, seed=7))
+        for k in range(100):
+            self.assertEqual(sorted(perms[k * 52 : (k + 1) * 52]), list(range(52)))
+        self.assertEqual(sorted(deal(perms[:52])), sorted(create_standard_deck()))
+
+    def test_monte_carlo(self):
+        serial = simulate(first_card_is_ace, 20000, seed=1, batch_size=2500)
+        self.assertEqual(serial.trials, 20000)
+        self.assertLess(abs(serial.probability - 1 / 13), 0.01)
+        self.assertTrue(serial.low <= serial.probability <= serial.high)
+        parallel = simulate(first_card_is_ace, 20000, seed=1, batch_size=2500, workers=2)
+        self.assertEqual(parallel, serial)
+
+        early = simulate(first_card_is_ace, 10**7, seed=1, batch_size=2000, target_half_width=0.01)
+        self.assertTrue(early.target_reached)
+        self.assertLess(early.trials, 10**7)
+        self.assertLessEqual(early.half_width, 0.01)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
 
     def test_rsa_roundtrip(self):
         kp = generate_keypair()
@@ -51,6 +174,81 @@ class TestAlgorithms(unittest.TestCase):
         out = decrypt_blocks(blocks, kp.private)
         self.assertEqual(out, msg)
 
+    def test_facade_result(self):
+        facade = AlgorithmsFacade()
+        result = facade.run("Merge Sort", {"array": list(range(1000, 0, -1))})
+        self.assertEqual(result.value, list(range(1, 1001)))
+        self.assertEqual(str(result), f"Sorted: {list(range(1, 1001))}")
+        preview = result.preview(max_items=3)
+        self.assertEqual(preview, "Sorted: [1, 2, 3, ... (994 more) ..., 998, 999, 1000]")
+
+    def test_facade_preview_small_results(self):
+        facade = AlgorithmsFacade()
+        shuffle = facade.run("Shuffle Deck", {"seed": 1})
+        self.assertEqual(shuffle.preview(), shuffle.text())
+        rsa = facade.run("RSA Encrypt/Decrypt", {"mode": "encrypt", "message": "x" * 30})
+        self.assertEqual(rsa.preview(), rsa.text())
+        stats = facade.run("Array Statistics", {"array": list(range(30))})
+        self.assertEqual(stats.preview(), stats.text())
+
+    def test_facade_preview_long_strings(self):
+        facade = AlgorithmsFacade()
+        kp = generate_keypair(p=1009, q=1013)
+        message = "abc" * 10000
+        blocks = " ".join(str(b) for b in encrypt_message(message, kp.public))
+        result = facade.run(
+            "RSA Encrypt/Decrypt",
+            {"mode": "decrypt", "ciphertext": blocks, "n": kp.private.n, "d": kp.private.d},
+        )
+        self.assertEqual(result.value, message)
+        self.assertIn(message, result.text())
+        self.assertLess(len(result.preview()), 1100)
+        self.assertIn("(29000 more chars)", result.preview())
+        self.assertEqual(format_value("x" * 9, max_items=2), "xx... (5 more chars) ...xx")
+
+    def test_format_large_int(self):
+        value = 7 ** 2000
+        digits = str(value)
+        self.assertEqual(format_value(value), digits)
+        preview = format_value(value, max_digits=10)
+        self.assertEqual(preview, f"{digits[:5]}...{digits[-5:]} ({len(digits)} digits)")
+        self.assertEqual(format_value(-123, max_digits=10), "-123")
+
+    def test_sort_stats(self):
+        stats = {}
+        bubble_sort([3, 1, 2], stats=stats)
+        self.assertEqual(stats, {"comparisons": 3, "swaps": 2})
+        stats = {}
+        selection_sort([1, 3, 2], stats=stats)
+        self.assertEqual(stats, {"comparisons": 3, "swaps": 1})
+        stats = {}
+        merge_sort([4, 3, 2, 1], stats=stats)
+        self.assertEqual(stats["comparisons"], 4)
+
+    def test_metrics_registry(self):
+        metrics = MetricsRegistry()
+        facade = AlgorithmsFacade(metrics=metrics)
+        facade.run("Bubble Sort", {"array": [2, 1]})
+        self.assertEqual(metrics.snapshot(), {"timings": {}, "counters": {}})
+
+        metrics.enable()
+        result = facade.run("Bubble Sort", {"array": [2, 1]})
+        result.preview()
+        snap = metrics.snapshot()
+        self.assertEqual(snap["counters"]["Bubble Sort.swaps"], 1)
+        self.assertEqual(snap["counters"]["Bubble Sort.calls"], 1)
+        for stage in ("facade.run", "algorithm.Bubble Sort", "format.preview"):
+            self.assertEqual(snap["timings"][stage]["count"], 1)
+
+        facade.run("Palindrome Substrings (DP)", {"text": "aba"})
+        self.assertEqual(metrics.snapshot()["counters"]["Palindrome Substrings (DP).memo_size"], 3)
+
+    def test_profile_command(self):
+        cmd = AlgorithmCommand(facade=AlgorithmsFacade(), name="Merge Sort", params={"array": [3, 2, 1]})
+        result, report = profile_command(cmd)
+        self.assertEqual(result.value, [1, 2, 3])
+        self.assertIn("merge_sort", report)
+
 
 if __name__ == "__main__":
     unittest.main()